@@ -13,5 +13,9 @@ def get_config():
         },
         "method": "GET",
         "log_file": "logs/api_stress_test.jsonl",
-        "timeout": 30.0  # Timeout in seconds
+        "timeout": 30.0,  # Timeout in seconds
+        "capture_body": False,  # Record response bodies in the log
+        "capture_headers": False,  # Record response headers in the log
+        "body_sink": None,  # e.g. "logs/bodies" to store bodies as separate files
+        "workers": 1,  # Number of processes to spread the load across
     }
\ No newline at end of file
@@ -1,26 +1,525 @@
 import httpx
+import aiofiles
 import asyncio
-import json
+import contextlib
+import errno
+import hashlib
+import heapq
+import numpy as np
+import orjson
 import time
-from datetime import datetime
-from typing import Any
+from typing import Any, Literal, NamedTuple
 import logging
+import multiprocessing
+import os
+import ssl
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from config import get_config as request_config
 
+# Initial size of the per-worker response body buffers
+BODY_BUFFER_SIZE = 64 * 1024
+
+# Each log record is serialized straight to a newline-terminated JSONL line
+LOG_DUMPS_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def peak_window_count(timestamps_ns: np.ndarray, window_ns: int) -> int:
+        """
+        Largest number of sorted timestamps that fall within any window of window_ns.
+
+        Compiled with Numba as a single two-pointer pass over the timestamps.
+        """
+        best = 0
+        start = 0
+        for end in range(len(timestamps_ns)):
+            while timestamps_ns[end] - timestamps_ns[start] >= window_ns:
+                start += 1
+            best = max(best, end - start + 1)
+        return best
+else:
+    def peak_window_count(timestamps_ns: np.ndarray, window_ns: int) -> int:
+        """
+        Largest number of sorted timestamps that fall within any window of window_ns.
+
+        Without Numba, searchsorted finds the end of every window in one vectorized pass.
+        """
+        ends = np.searchsorted(timestamps_ns, timestamps_ns + window_ns)
+        return int((ends - np.arange(len(timestamps_ns))).max(initial=0))
+
+
+class UringLogWriter:
+    """
+    Append-only log sink that submits writes through io_uring on Linux.
+
+    Each batch of log lines is pushed as a single write SQE on a long-lived
+    ring. The ring signals completions on an eventfd watched by the event loop,
+    so a write is awaited like any other I/O instead of blocking a thread on
+    the disk.
+    """
+
+    # Offset of -1 as an unsigned 64-bit value: write at the current file position
+    CURRENT_POSITION = (1 << 64) - 1
+
+    def __init__(self, path: str, entries: int = 256):
+        """
+        Open the log file, set up the submission ring and watch its completions.
+
+        Must be called from a running event loop.
+
+        Args:
+            path (str): Path to the log file to append to
+            entries (int): Number of submission queue entries for the ring
+
+        Raises:
+            OSError: If the kernel cannot set up the ring or lacks IORING_OP_WRITE (< 5.6)
+        """
+        self.loop = asyncio.get_running_loop()
+        self.fd = self.eventfd = None
+        self.ring = None
+        self.cqe = liburing.Cqe()
+        # In-flight writes by user_data, holding their buffers alive until the kernel is done
+        self._pending: dict[int, tuple[asyncio.Future, bytes]] = {}
+        self._next_id = 0
+        try:
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(entries, ring)
+            self.ring = ring
+            probe = liburing.io_uring_get_probe_ring(self.ring)
+            try:
+                if not liburing.io_uring_opcode_supported(probe, liburing.io_uring_op.IORING_OP_WRITE):
+                    raise OSError(errno.ENOSYS, "io_uring does not support IORING_OP_WRITE")
+            finally:
+                liburing.io_uring_free_probe(probe)
+            self.fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self.eventfd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            liburing.io_uring_register_eventfd(self.ring, self.eventfd)
+            self.loop.add_reader(self.eventfd, self._reap)
+        except BaseException:
+            self.close()
+            raise
+
+    def _reap(self):
+        # Reset the eventfd counter first, so completions posted meanwhile signal again
+        with contextlib.suppress(BlockingIOError):
+            os.eventfd_read(self.eventfd)
+        while True:
+            try:
+                liburing.io_uring_peek_cqe(self.ring, self.cqe)
+            except BlockingIOError:
+                return
+            cqe = self.cqe[0]
+            future, _ = self._pending.pop(cqe.user_data)
+            written = cqe.res
+            liburing.io_uring_cqe_seen(self.ring, cqe)
+            if future.done():
+                continue
+            if written < 0:
+                future.set_exception(OSError(-written, os.strerror(-written)))
+            else:
+                future.set_result(written)
+
+    async def _write_at_position(self, data: bytes) -> int:
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_write(sqe, self.fd, data, self.CURRENT_POSITION)
+        write_id = self._next_id
+        self._next_id += 1
+        liburing.io_uring_sqe_set_data64(sqe, write_id)
+        future = self.loop.create_future()
+        self._pending[write_id] = (future, data)
+        liburing.io_uring_submit(self.ring)
+        return await future
+
+    async def write(self, data: bytes):
+        """
+        Append a batch of log lines to the file.
+
+        Args:
+            data (bytes): One or more newline-terminated JSONL records
+        """
+        # Resubmit the remainder on short writes until the whole batch is on disk
+        while data:
+            data = data[await self._write_at_position(data):]
+
+    def close(self):
+        """Stop watching completions, tear down the ring and close the file descriptors."""
+        if self.eventfd is not None:
+            self.loop.remove_reader(self.eventfd)
+        if self.ring is not None:
+            if self._pending:
+                # Wait for writes still owned by the kernel before their buffers are freed
+                liburing.io_uring_submit_and_wait(self.ring, len(self._pending))
+                self._reap()
+            liburing.io_uring_queue_exit(self.ring)
+            self.ring = None
+        for fd in (self.eventfd, self.fd):
+            if fd is not None:
+                os.close(fd)
+        self.fd = self.eventfd = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+def open_log_sink(path: str):
+    """
+    Open the fastest available async log sink for the given path.
+
+    Uses io_uring when liburing is installed on Linux and the kernel (5.6+)
+    supports it, otherwise falls back to aiofiles. Must be called from a
+    running event loop.
+
+    Args:
+        path (str): Path to the log file to append to
+
+    Returns:
+        An async context manager exposing an awaitable write(bytes) method
+    """
+    if liburing is not None and sys.platform == "linux":
+        try:
+            return UringLogWriter(path)
+        except Exception:
+            # No io_uring writes on this kernel, ring setup refused, or an incompatible liburing
+            pass
+    return aiofiles.open(path, 'ab')
+
+
+def create_ssl_context(http2: bool = False) -> ssl.SSLContext:
+    """
+    Create a TLS client context meant to be shared by every connection of a run.
+
+    Builds on httpx's defaults, so every backend verifies against the certifi
+    bundle and honors SSL_CERT_FILE / SSL_CERT_DIR. Loading the CA bundle is the
+    expensive part of building a context, so one context is reused for the whole run.
+
+    Args:
+        http2 (bool): Advertise HTTP/2 via ALPN in addition to HTTP/1.1
+
+    Returns:
+        ssl.SSLContext: The client context
+    """
+    context = httpx.create_ssl_context()
+    context.set_alpn_protocols(["h2", "http/1.1"] if http2 else ["http/1.1"])
+    return context
+
+
+class RawResponse(NamedTuple):
+    """The subset of an HTTP response recorded by the tester, independent of the backend."""
+    status_code: int
+    raw_headers: list[tuple[bytes, bytes]]
+    content: bytes | memoryview
+    content_type: str
+    encoding: str | None
+
+
+class RawHTTPConnectionPool:
+    """
+    Minimal keep-alive HTTP/1.1 client that replays one pre-serialized request.
+
+    The full request (request line, headers and body) is encoded to bytes once,
+    so each send is a single socket write followed by parsing just enough of the
+    response to frame the body. Response headers are only collected when
+    capture_headers is enabled. Concurrency is bounded by the caller, so
+    the pool never holds more idle connections than concurrent senders.
+    """
+
+    def __init__(
+        self,
+        url: httpx.URL,
+        method: str,
+        headers: httpx.Headers,
+        body: bytes | None,
+        timeout: float,
+        capture_headers: bool = False,
+        ssl_context: ssl.SSLContext | None = None
+    ):
+        """
+        Pre-serialize the request and prepare connection settings.
+
+        Args:
+            url (httpx.URL): The full target URL, including query parameters
+            method (str): HTTP method to use
+            headers (httpx.Headers): HTTP headers to include with each request
+            body (bytes): Optional JSON-encoded request body
+            timeout (float): Per-request timeout in seconds
+            capture_headers (bool): Collect the raw response headers for each response
+            ssl_context (ssl.SSLContext): TLS context for https URLs, shared across pools
+        """
+        self.host = url.host
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.ssl = (ssl_context or create_ssl_context()) if url.scheme == "https" else None
+        self.method = method
+        self.timeout = timeout
+        self.capture_headers = capture_headers
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+        lines = [method.encode() + b" " + url.raw_path + b" HTTP/1.1", b"Host: " + url.netloc]
+        lines += [key + b": " + value for key, value in headers.raw if key.lower() != b"host"]
+        if body is not None:
+            if "content-type" not in headers:
+                lines.append(b"Content-Type: application/json")
+            lines.append(b"Content-Length: " + str(len(body)).encode())
+        self.request_bytes = b"\r\n".join(lines) + b"\r\n\r\n" + (body or b"")
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl, server_hostname=self.host if self.ssl else None
+        )
+
+    async def warm_up(self, connections: int):
+        """
+        Open idle connections ahead of the timed requests.
+
+        Args:
+            connections (int): Number of connections to open
+        """
+        opened = await asyncio.gather(
+            *[asyncio.wait_for(self._connect(), self.timeout) for _ in range(connections)],
+            return_exceptions=True
+        )
+        self._idle.extend(conn for conn in opened if not isinstance(conn, BaseException))
+
+    async def send(self) -> RawResponse:
+        """
+        Send the pre-serialized request over an idle or new connection.
+
+        Returns:
+            RawResponse: The status code, optional raw headers and body of the response
+        """
+        # Connecting counts against the same per-request timeout as the exchange
+        async with asyncio.timeout(self.timeout):
+            if self._idle:
+                reader, writer = self._idle.pop()
+                try:
+                    return await self._send_on(reader, writer)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # The server closed the idle connection; retry once on a fresh one
+                    pass
+            reader, writer = await self._connect()
+            return await self._send_on(reader, writer)
+
+    async def _send_on(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> RawResponse:
+        try:
+            writer.write(self.request_bytes)
+            await writer.drain()
+            response, keep_alive = await self._read_response(reader)
+        except BaseException:
+            writer.close()
+            raise
+
+        if keep_alive:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return response
+
+    async def _read_response(self, reader: asyncio.StreamReader) -> tuple[RawResponse, bool]:
+        head = memoryview(await reader.readuntil(b"\r\n\r\n"))
+        # Status line is "HTTP/1.x NNN reason"
+        status_code = int(head[9:12])
+        keep_alive = head[:8] == b"HTTP/1.1"
+
+        content_length = None
+        chunked = False
+        content_type = ""
+        raw_headers = []
+        for line in bytes(head[:-4]).split(b"\r\n")[1:]:
+            key, _, value = line.partition(b":")
+            key = key.strip()
+            value = value.strip()
+            if self.capture_headers:
+                raw_headers.append((key, value))
+            key = key.lower()
+            if key == b"content-length":
+                content_length = int(value)
+            elif key == b"transfer-encoding":
+                chunked = b"chunked" in value.lower()
+            elif key == b"connection":
+                keep_alive = value.lower() != b"close"
+            elif key == b"content-type":
+                content_type = value.decode("latin-1")
+
+        if self.method == "HEAD" or status_code in (204, 304) or 100 <= status_code < 200:
+            content = b""
+        elif chunked:
+            content = await self._read_chunked(reader)
+        elif content_length is not None:
+            content = await reader.readexactly(content_length)
+        else:
+            # No framing information: the body runs until the server closes the connection
+            content = await reader.read()
+            keep_alive = False
+        return RawResponse(status_code, raw_headers, content, content_type, None), keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class RollingPercentile:
+    """
+    Percentile of the most recent response times, kept in a fixed-size NumPy ring buffer.
+
+    The percentile is only recomputed every refresh_every samples, and is None
+    until min_samples response times have been recorded.
+    """
+
+    def __init__(self, q: float = 99.0, size: int = 1024, min_samples: int = 100, refresh_every: int = 64):
+        """
+        Initialize an empty ring buffer.
+
+        Args:
+            q (float): Percentile to track, between 0 and 100
+            size (int): Number of most recent samples to keep
+            min_samples (int): Samples required before a percentile is reported
+            refresh_every (int): Number of new samples between recomputations
+        """
+        self.q = q
+        self.min_samples = min_samples
+        self.refresh_every = refresh_every
+        self.samples = np.zeros(size, dtype=np.float32)
+        self.count = 0
+        self.value = None
+
+    def add(self, sample: float):
+        """
+        Record a new sample, overwriting the oldest one once the buffer is full.
+
+        Args:
+            sample (float): The sample to record
+        """
+        self.samples[self.count % len(self.samples)] = sample
+        self.count += 1
+        if self.count >= self.min_samples and self.count % self.refresh_every == 0:
+            self.value = float(np.percentile(self.samples[:min(self.count, len(self.samples))], self.q))
+
+
+class Target(NamedTuple):
+    """
+    An endpoint to include in a multi-target stress test.
+
+    Attributes:
+        url (str): The target API endpoint URL
+        weight (float): Relative share of the concurrency budget for this target
+        count (int): Number of requests to send to this target; when no target sets one,
+            total_requests is split across the targets by weight
+    """
+    url: str
+    weight: float = 1.0
+    count: int | None = None
+
+
+class WeightedFairScheduler:
+    """
+    Weighted fair dispatcher deciding which target a free worker serves next.
+
+    Whenever a worker becomes free it takes the target with the fewest in-flight
+    requests per unit of weight, so a slow endpoint can only hold its weighted
+    share of the concurrency budget instead of gradually absorbing every worker.
+    Ties are broken by a per-target virtual-time cursor that advances by
+    1 / weight per dispatched request, which keeps dispatch proportional to the
+    weights while targets respond equally fast.
+    """
+
+    def __init__(self, targets: list[Target]):
+        """
+        Initialize the scheduler state for the given targets.
+
+        Args:
+            targets (list): Targets with their weight and resolved request count
+        """
+        self.weights = [target.weight for target in targets]
+        self.remaining = [target.count for target in targets]
+        self.in_flight = [0] * len(targets)
+        self.virtual_time = [0.0] * len(targets)
+        self.next_request_id = 1
+
+    def next(self) -> tuple[int, int] | None:
+        """
+        Pick the target for the next request.
+
+        Returns:
+            tuple: The (request_id, target_index) to send, or None once every target is exhausted
+        """
+        candidates = [i for i, remaining in enumerate(self.remaining) if remaining]
+        if not candidates:
+            return None
+        index = min(candidates, key=lambda i: (self.in_flight[i] / self.weights[i], self.virtual_time[i]))
+
+        self.remaining[index] -= 1
+        self.in_flight[index] += 1
+        self.virtual_time[index] += 1 / self.weights[index]
+        request_id = self.next_request_id
+        self.next_request_id += 1
+        return request_id, index
+
+    def done(self, index: int):
+        """
+        Release the concurrency slot held by a finished request.
+
+        Args:
+            index (int): Index of the target the request was sent to
+        """
+        self.in_flight[index] -= 1
+
+
 class APIStressTester:
     """
     A class for performing stress testing on APIs by making concurrent HTTP requests.
     
     This class allows you to test an API endpoint by sending multiple requests concurrently
     and collecting detailed metrics about the responses including status codes, response times,
-    and any errors encountered.
+    and any errors encountered. Several endpoints can be tested at once by passing targets,
+    which share the concurrency budget according to their weights.
     """
 
     def __init__(
         self,
-        base_url: str,
+        base_url: str | None = None,
         total_requests: int = 100,
         concurrent_requests: int = 10,
         headers: dict[str, str] | None = None,
@@ -28,14 +527,26 @@ class APIStressTester:
         data: dict[str, Any] | None = None,
         method: str = "GET",
         log_file: str = "api_stress_test.jsonl",
-        timeout: float = 60.0
+        timeout: float = 60.0,
+        capture_body: bool = False,
+        capture_headers: bool = False,
+        body_sink: str | None = None,
+        http2: bool = True,
+        warmup: bool = True,
+        log_successes: bool = True,
+        backend: Literal["httpx", "aiohttp", "raw"] = "httpx",
+        targets: list[Target] | None = None,
+        starvation_limit: float | None = 0.01,
+        cancel_factor: float | None = None,
+        request_id_offset: int = 0
     ):
         """
         Initialize the API stress tester.
 
         Args:
-            base_url (str): The target API endpoint URL
-            total_requests (int): Total number of requests to make
+            base_url (str): The target API endpoint URL, when testing a single endpoint
+            total_requests (int): Total number of requests to make; split across targets by weight
+                unless every target sets its own count
             concurrent_requests (int): Number of requests to make concurrently
             headers (dict): Optional HTTP headers to include with each request
             params (dict): Optional query parameters to include with each request
@@ -43,9 +554,49 @@ class APIStressTester:
             method (str): HTTP method to use (GET, POST, etc.)
             log_file (str): Path to the log file where results will be stored
             timeout (float): Request timeout in seconds
+            capture_body (bool): Record response bodies in addition to request metadata
+            capture_headers (bool): Record response headers in addition to request metadata
+            body_sink (str): Optional directory for captured bodies; when set, raw bodies are
+                written there as one file per request and only the file name and sha256 are logged
+            http2 (bool): Negotiate HTTP/2 so concurrent requests multiplex over shared connections
+            warmup (bool): Open the connection pool with unlogged HEAD requests before timing starts
+            log_successes (bool): Write a JSONL record for successful requests too, not only failures
+            backend (str): HTTP client to drive the requests with: "httpx", "aiohttp" (leaner
+                C-accelerated client) or "raw" (pre-serialized HTTP/1.1 over asyncio streams)
+            targets (list): Several endpoints to test concurrently instead of base_url
+            starvation_limit (float): Maximum seconds to keep reading a response body before
+                yielding to the event loop, or None to never force a yield
+            cancel_factor (float): Cancel requests that take longer than this multiple of the
+                target's rolling p99 response time, or None to only rely on timeout
+            request_id_offset (int): Added to every logged request id, keeping ids unique when
+                the run is split across worker processes
         """
+        if (base_url is None) == (targets is None):
+            raise ValueError("Pass exactly one of base_url or targets")
+        if targets is None:
+            targets = [Target(base_url, count=total_requests)]
+        if not targets or any(target.weight <= 0 for target in targets):
+            raise ValueError("Targets must be non-empty and have positive weights")
+        if all(target.count is None for target in targets):
+            # Split total_requests by weight, handing the rounding leftovers to the
+            # targets whose share lost the largest fraction
+            weights = np.array([target.weight for target in targets])
+            shares = weights * (max(total_requests, 0) / weights.sum())
+            counts = np.floor(shares).astype(np.int64)
+            counts[np.argsort(counts - shares, kind="stable")[:max(total_requests, 0) - int(counts.sum())]] += 1
+            targets = [target._replace(count=int(count)) for target, count in zip(targets, counts)]
+        elif any(target.count is None for target in targets):
+            raise ValueError("Either every target or none of them must set a count")
+        if total_requests < 0 or any(target.count < 0 for target in targets):
+            raise ValueError("Request counts must not be negative")
+        if backend not in ("httpx", "aiohttp", "raw"):
+            raise ValueError(f"Unknown backend {backend!r}, expected 'httpx', 'aiohttp' or 'raw'")
+        if backend == "aiohttp" and aiohttp is None:
+            raise ImportError("The aiohttp backend requires the 'aiohttp' package to be installed")
+
         self.base_url = base_url
-        self.total_requests = total_requests
+        self.targets = targets
+        self.total_requests = sum(target.count for target in targets)
         self.concurrent_requests = concurrent_requests
         self.headers = headers or {}
         self.params = params or {}
@@ -53,80 +604,552 @@ class APIStressTester:
         self.method = method.upper()
         self.log_file = log_file
         self.timeout = timeout
-        self.results = []
+        self.capture_body = capture_body
+        self.capture_headers = capture_headers
+        self.body_sink = Path(body_sink) if body_sink is not None else None
+        self.http2 = http2
+        self.warmup = warmup
+        self.log_successes = log_successes
+        self.backend = backend
+        self.starvation_limit = starvation_limit
+        self.cancel_factor = cancel_factor
+        self.request_id_offset = request_id_offset
+        # Per target, so a fast target's p99 never becomes a slow target's cutoff
+        self._p99 = [RollingPercentile(99.0) for _ in targets]
+        # One reusable body buffer per worker, allocated by _dispatch for the backends that stream bodies
+        self._body_buffers: list[bytearray] = []
+        # Only the httpx backend speaks HTTP/2
+        self._ssl_context = create_ssl_context(http2=http2 and backend == "httpx")
+        self._send = getattr(self, f"_send_{backend}")
+        self._log_queue = None
+        self._request_templates = None
 
-    async def make_request(self, client: httpx.AsyncClient, request_id: int) -> dict[str, Any]:
+        # Struct-of-arrays metrics indexed by request_id - 1; status code 0 means
+        # no response was received
+        self.status_codes = np.zeros(self.total_requests, dtype=np.int16)
+        self.response_times_ms = np.zeros(self.total_requests, dtype=np.float32)
+        self.content_lengths = np.zeros(self.total_requests, dtype=np.int64)
+        self.timestamps_ns = np.zeros(self.total_requests, dtype=np.int64)
+        self.success = np.zeros(self.total_requests, dtype=np.bool_)
+        self.target_indices = np.zeros(self.total_requests, dtype=np.int16)
+
+        # Everything that is constant for the run is validated and serialized once
+        self._httpx_headers = httpx.Headers(self.headers)
+        self._httpx_params = httpx.QueryParams(self.params)
+        self._json_data = self.data if self.method in ["POST", "PUT", "PATCH"] else None
+        # Same URLs httpx builds from each target url + params, for the non-httpx backends
+        self._full_urls = [httpx.URL(target.url, params=self._httpx_params) for target in targets]
+        self._body = orjson.dumps(self._json_data) if self._json_data is not None else None
+        if backend == "aiohttp":
+            # The URLs are already fully encoded, so aiohttp must not re-quote them
+            self._aiohttp_urls = [yarl.URL(str(url), encoded=True) for url in self._full_urls]
+        # Request headers, params and data are constant for the run, so they go to
+        # the run manifest once instead of into every log record
+        self._static_json_prefixes = [orjson.dumps({
+            "url": target.url,
+            "method": self.method
+        })[:-1] for target in targets]
+
+    async def make_request(self, client: Any, request_id: int, target_index: int = 0, worker_index: int = 0):
         """
         Make a single async HTTP request and record the results.
 
+        Metrics are written straight into the pre-allocated metric arrays at
+        index request_id - 1. A JSONL record is only built for failed requests,
+        or for every request when log_successes is enabled.
+
         Args:
-            client (httpx.AsyncClient): The HTTP async client to use for making requests
+            client: The backend client to use for making requests, as opened by run()
             request_id (int): Unique identifier for this request
+            target_index (int): Index of the target to send the request to
+            worker_index (int): Index of the worker sending the request, selecting its body buffer
+        """
+        index = request_id - 1
+        timestamp_ns = time.time_ns()
+        self.timestamps_ns[index] = timestamp_ns
+        self.target_indices[index] = target_index
+        # Cap this request at a multiple of its target's recent p99 so hung
+        # connections give their slot back instead of waiting for the full timeout
+        p99 = self._p99[target_index]
+        deadline = None
+        if self.cancel_factor is not None and p99.value is not None:
+            deadline = asyncio.get_running_loop().time() + self.cancel_factor * p99.value / 1000
+        guard = asyncio.timeout_at(deadline)
+        start_ns = time.perf_counter_ns()
+
+        try:
+            async with guard:
+                response = await self._send(client, target_index, worker_index)
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6  # Convert to milliseconds
+            p99.add(response_time)
+
+            # Read the body once and derive both the length and the captured value from it
+            raw = response.content
+            success = 200 <= response.status_code < 300
+            if self.log_successes or not success:
+                result = {
+                    "request_id": request_id + self.request_id_offset,
+                    "timestamp_ns": timestamp_ns,
+                    "status_code": response.status_code,
+                    "response_time_ms": round(response_time, 2),
+                    "success": success,
+                    "content_length": len(raw),
+                }
+                if self.capture_headers:
+                    # A list of pairs straight from the raw headers is cheaper than a dict
+                    result["response_headers_raw"] = [
+                        (key.decode("latin-1"), value.decode("latin-1")) for key, value in response.raw_headers
+                    ]
+                if self.capture_body:
+                    await self._capture_body(result, raw, response.content_type, response.encoding)
+                await self._log_result(result, target_index)
+            # Only recorded once capturing and logging went through, so the metrics
+            # never claim a success the log reports as an error
+            self.status_codes[index] = response.status_code
+            self.response_times_ms[index] = response_time
+            self.content_lengths[index] = len(raw)
+            self.success[index] = success
+
+        except Exception as e:
+            # Record error details if request fails
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
+            self.response_times_ms[index] = response_time
+            # Failed and cancelled requests feed the window too (cancelled ones with
+            # the cutoff they reached), so it is not biased towards fast survivors
+            p99.add(response_time)
+            result = {
+                "request_id": request_id + self.request_id_offset,
+                "timestamp_ns": timestamp_ns,
+                "status_code": None,
+                "response_time_ms": round(response_time, 2),
+                "success": False,
+                # repr() keeps the exception type; str() of a timeout is empty
+                "error": repr(e),
+            }
+            if guard.expired():
+                result["cancelled"] = True
+                result["error"] = f"Cancelled after exceeding {self.cancel_factor}x the target's rolling p99 response time"
+            await self._log_result(result, target_index)
+
+    async def _read_body(self, chunks, worker_index: int) -> memoryview:
+        """
+        Collect a streamed response body without monopolizing the event loop.
+
+        Chunks are copied into the worker's reusable body buffer instead of
+        allocating a new bytes object per response; the buffer is replaced by a
+        larger one when a body does not fit. When chunks keep arriving without
+        the socket ever blocking, the loop would otherwise never switch to other
+        requests; after starvation_limit seconds of reading this forces a yield.
+
+        Args:
+            chunks: Async iterator over the body chunks
+            worker_index (int): Index of the worker whose buffer receives the body
+
+        Returns:
+            memoryview: The response body, valid until the worker's next request
+        """
+        buffer = self._body_buffers[worker_index]
+        size = 0
+        last_yield = time.monotonic()
+        async for chunk in chunks:
+            end = size + len(chunk)
+            if end > len(buffer):
+                grown = bytearray(max(end, 2 * len(buffer)))
+                grown[:size] = buffer[:size]
+                buffer = self._body_buffers[worker_index] = grown
+            buffer[size:end] = chunk
+            size = end
+            if self.starvation_limit is not None and time.monotonic() - last_yield > self.starvation_limit:
+                await asyncio.sleep(0)
+                last_yield = time.monotonic()
+        return memoryview(buffer)[:size]
+
+    def _build_httpx_request(self, client: httpx.AsyncClient, target_index: int) -> httpx.Request:
+        return client.build_request(
+            method=self.method,
+            url=self.targets[target_index].url,
+            params=self._httpx_params,
+            json=self._json_data
+        )
+
+    async def _send_httpx(self, client: httpx.AsyncClient, target_index: int, worker_index: int) -> RawResponse:
+        # Every request to a target is identical, so send the request built once by run(),
+        # unless the server has set cookies since, which only build_request merges in
+        request = self._request_templates[target_index]
+        if client.cookies:
+            request = self._build_httpx_request(client, target_index)
+        response = await client.send(request, stream=True)
+        try:
+            content = await self._read_body(response.aiter_bytes(), worker_index)
+        finally:
+            await response.aclose()
+        content_type = response.headers.get("content-type", "")
+        return RawResponse(response.status_code, response.headers.raw, content, content_type, response.encoding)
+
+    async def _send_aiohttp(self, session: "aiohttp.ClientSession", target_index: int, worker_index: int) -> RawResponse:
+        async with session.request(self.method, self._aiohttp_urls[target_index], data=self._body) as response:
+            content = await self._read_body(response.content.iter_any(), worker_index)
+            content_type = response.headers.get("Content-Type", "")
+            return RawResponse(response.status, response.raw_headers, content, content_type, response.charset)
+
+    async def _send_raw(self, pools: list[RawHTTPConnectionPool], target_index: int, worker_index: int) -> RawResponse:
+        return await pools[target_index].send()
+
+    def _open_client(self):
+        """
+        Open the client for the configured backend.
 
         Returns:
-            dict: A dictionary containing detailed information about the request and response
+            An async context manager yielding the client passed to make_request
+        """
+        keepalive_expiry = max(30.0, self.timeout)
+        if self.backend == "aiohttp":
+            headers = dict(self._httpx_headers)
+            if self._body is not None and "content-type" not in self._httpx_headers:
+                headers["Content-Type"] = "application/json"
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrent_requests,
+                limit_per_host=self.concurrent_requests,
+                keepalive_timeout=keepalive_expiry,
+                ssl=self._ssl_context
+            )
+            return aiohttp.ClientSession(
+                connector=connector,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        if self.backend == "raw":
+            return self._open_raw_pools()
+
+        # Configure connection pooling limits to match the concurrency cap
+        limits = httpx.Limits(
+            max_keepalive_connections=self.concurrent_requests,
+            max_connections=self.concurrent_requests,
+            # Never let pooled connections expire between bursts of slow requests
+            keepalive_expiry=keepalive_expiry
+        )
+        return httpx.AsyncClient(
+            http2=self.http2,
+            verify=self._ssl_context,
+            timeout=self.timeout,
+            limits=limits,
+            headers=self._httpx_headers
+        )
+
+    @contextlib.asynccontextmanager
+    async def _open_raw_pools(self):
+        # The raw backend talks to a single host per pool, so each target gets its own
+        async with contextlib.AsyncExitStack() as stack:
+            pools = []
+            for url in self._full_urls:
+                pool = RawHTTPConnectionPool(
+                    url,
+                    self.method,
+                    self._httpx_headers,
+                    self._body,
+                    self.timeout,
+                    capture_headers=self.capture_headers,
+                    ssl_context=self._ssl_context
+                )
+                pools.append(await stack.enter_async_context(pool))
+            yield pools
+
+    async def _capture_body(self, result: dict[str, Any], raw: bytes | memoryview, content_type: str, encoding: str | None):
+        """
+        Attach a captured response body to the request result.
+
+        Without a body sink the body is embedded in the log record, parsed when
+        the Content-Type says it is JSON and as text otherwise, so non-JSON
+        endpoints never pay for a failed parse. With a sink the raw bytes are
+        queued for the background writer and only a reference to the sidecar
+        file is logged.
+
+        Args:
+            result (dict): The request result being built
+            raw (bytes): The raw response body, possibly a view into a reused buffer
+            content_type (str): The response Content-Type header, empty if missing
+            encoding (str): The response text encoding, if known
+        """
+        if self.body_sink is not None:
+            body_file = self.body_sink / f"{result['request_id']:08d}.bin"
+            # The writer runs later, after the worker's buffer may have been reused;
+            # the bounded queue makes workers wait when sidecar writes fall behind
+            await self._log_queue.put((body_file, bytes(raw)))
+            result["body_file"] = body_file.name
+            result["body_sha256"] = hashlib.sha256(raw).hexdigest()
+            return
+
+        if 'json' in content_type.lower():
+            try:
+                result["response_body"] = orjson.loads(raw)
+                return
+            except orjson.JSONDecodeError:
+                # Declared as JSON but malformed; keep the text for inspection
+                pass
+        result["response_body"] = str(raw, encoding or 'utf-8', errors='replace')
+
+    async def _log_result(self, result: dict[str, Any], target_index: int = 0):
+        """
+        Queue a single request result to be logged in JSONL format.
+
+        The line is handed to the background writer started by run(), so the
+        request coroutine never blocks on disk I/O; it only waits when the
+        bounded queue is full because the disk is falling behind. Only the
+        per-request fields are serialized; they are spliced onto the
+        pre-serialized run constants.
+
+        Args:
+            result (dict): The per-request fields to log
+            target_index (int): Index of the target the request was sent to
+        """
+        fields = orjson.dumps(result, option=LOG_DUMPS_OPTIONS)
+        await self._log_queue.put(self._static_json_prefixes[target_index] + b',' + fields[1:])
+
+    async def _log_writer(self):
+        """
+        Drain queued log lines to the log file until a None sentinel arrives.
+
+        Every line already waiting in the queue is joined into a single
+        non-blocking write, so disk I/O is batched under load. Captured bodies
+        queued as (path, bytes) pairs are written to their own sidecar files.
+        """
+        async with open_log_sink(self.log_file) as f:
+            while True:
+                items = [await self._log_queue.get()]
+                while not self._log_queue.empty():
+                    items.append(self._log_queue.get_nowait())
+
+                done = items[-1] is None
+                if done:
+                    items.pop()
+
+                lines = []
+                for item in items:
+                    if isinstance(item, tuple):
+                        body_file, raw = item
+                        async with aiofiles.open(body_file, 'wb') as body_fp:
+                            await body_fp.write(raw)
+                    else:
+                        lines.append(item)
+                if lines:
+                    await f.write(b''.join(lines))
+                if done:
+                    return
+
+    async def _warm_up(self, client: Any):
+        """
+        Open the connection pool before the timed requests start.
+
+        Sends unlogged HEAD requests, splitting the pool slots across targets, so
+        TCP/TLS handshakes are not counted in the measured response times.
+        Failures are ignored; the timed requests will surface any real
+        connectivity problem.
+
+        Args:
+            client: The backend client to warm up, as opened by run()
+        """
+        per_target = max(1, self.concurrent_requests // len(self.targets))
+        if self.backend == "raw":
+            await asyncio.gather(*[pool.warm_up(per_target) for pool in client])
+            return
+
+        async def head(target_index: int):
+            if self.backend == "aiohttp":
+                async with client.head(self._aiohttp_urls[target_index]):
+                    pass
+            else:
+                await client.head(self.targets[target_index].url)
+
+        await asyncio.gather(
+            *[head(i) for i in range(len(self.targets)) for _ in range(per_target)],
+            return_exceptions=True
+        )
+
+    def _write_manifest(self):
+        """
+        Write the run-level settings that are constant across all requests.
+
+        The manifest sits next to the log file with a .manifest.json suffix and
+        holds everything per-request log records leave out.
         """
-        start_time = time.time()
-        result = {
-            "request_id": request_id,
-            "timestamp": datetime.now().isoformat(),
-            "url": self.base_url,
+        manifest = {
+            "timestamp_ns": time.time_ns(),
+            "targets": [target._asdict() for target in self.targets],
             "method": self.method,
             "headers": self.headers,
             "params": self.params,
-            "data": self.data
+            "data": self.data,
+            "total_requests": self.total_requests,
+            "concurrent_requests": self.concurrent_requests,
+            "timeout": self.timeout,
+            "backend": self.backend,
+            "http2": self.http2,
         }
+        Path(self.log_file).with_suffix('.manifest.json').write_bytes(
+            orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
 
-        try:
-            # Make the HTTP request
-            response = await client.request(
-                method=self.method,
-                url=self.base_url,
-                headers=self.headers,
-                params=self.params,
-                json=self.data if self.method in ["POST", "PUT", "PATCH"] else None
-            )
-            end_time = time.time()
-            response_time = (end_time - start_time) * 1000  # Convert to milliseconds
+    def _save_metrics(self):
+        """
+        Save the per-request metric arrays next to the log file.
 
-            # Record successful response details
-            result.update({
-                "status_code": response.status_code,
-                "response_time_ms": round(response_time, 2),
-                "success": 200 <= response.status_code < 300,
-                "response_headers": dict(response.headers),
-                "content_length": len(response.content),
-            })
+        The arrays are written as a compressed NumPy archive with the log
+        file's suffix replaced by .npz, ready for vectorized analysis.
+        """
+        np.savez_compressed(
+            Path(self.log_file).with_suffix('.npz'),
+            status_codes=self.status_codes,
+            response_times_ms=self.response_times_ms,
+            content_lengths=self.content_lengths,
+            timestamps_ns=self.timestamps_ns,
+            success=self.success,
+            target_indices=self.target_indices
+        )
 
-            # Try to parse response as JSON, fall back to text if not possible
-            try:
-                result["response_body"] = response.json()
-            except:
-                result["response_body"] = response.text
+    def summarize(self) -> dict[str, Any]:
+        """
+        Aggregate the per-request metric arrays into a run summary.
 
-        except Exception as e:
-            # Record error details if request fails
-            end_time = time.time()
-            response_time = (end_time - start_time) * 1000
-            result.update({
-                "status_code": None,
-                "response_time_ms": round(response_time, 2),
-                "success": False,
-                "error": str(e),
-            })
+        Every statistic is a vectorized NumPy call over the metric arrays, and
+        the peak throughput uses the compiled sliding-window kernel, so the
+        cost stays negligible even for millions of requests.
+
+        Returns:
+            dict: Request counts, status code histogram, response time statistics
+                and throughput of the run
+        """
+        responded = self.status_codes > 0
+        times = self.response_times_ms[responded]
+        status_counts = np.bincount(self.status_codes[responded].clip(0, 599), minlength=600)
+        successful = int(self.success.sum())
+
+        response_time_ms = {}
+        if times.size:
+            p50, p90, p95, p99, p999 = np.percentile(times, [50, 90, 95, 99, 99.9])
+            response_time_ms = {
+                "min": float(times.min()),
+                "mean": float(times.mean()),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p95": float(p95),
+                "p99": float(p99),
+                "p99.9": float(p999),
+                "max": float(times.max()),
+            }
+
+        started = np.sort(self.timestamps_ns)
+        duration_s = 0.0
+        if started.size:
+            finished = self.timestamps_ns + (self.response_times_ms * 1e6).astype(np.int64)
+            duration_s = (finished.max() - started[0]) / 1e9
+
+        return {
+            "total_requests": self.total_requests,
+            "successful": successful,
+            "failed": self.total_requests - successful,
+            "no_response": int((~responded).sum()),
+            "status_codes": {int(code): int(status_counts[code]) for code in np.flatnonzero(status_counts)},
+            "response_time_ms": response_time_ms,
+            "duration_s": duration_s,
+            "requests_per_second": self.total_requests / duration_s if duration_s > 0 else 0.0,
+            # Busiest one second window, scaled down to the run itself when it was shorter
+            "peak_requests_per_second": (
+                peak_window_count(started, 1_000_000_000) / min(1.0, duration_s) if duration_s > 0 else 0.0
+            ),
+        }
+
+    def merge_shards(self, shard_logs: list[str]):
+        """
+        Merge the logs and metrics of a run split across worker processes.
+
+        Shard metric arrays are concatenated in shard order (matching the request
+        id offsets), shard log records are streamed into log_file ordered by
+        request start time, and the manifest and metrics archive are written for
+        the whole run. The shard files are removed afterwards.
+
+        Args:
+            shard_logs (list): Log files of the shards, in request id offset order
+        """
+        names = ("status_codes", "response_times_ms", "content_lengths", "timestamps_ns", "success", "target_indices")
+        columns = {name: [] for name in names}
+        for shard_log in shard_logs:
+            with np.load(Path(shard_log).with_suffix('.npz')) as shard:
+                for name in names:
+                    columns[name].append(shard[name])
+        for name in names:
+            getattr(self, name)[:] = np.concatenate(columns[name])
+
+        # The metrics say which requests were logged and when each one started,
+        # so every shard's records can be put in start order without loading the shard
+        logged = np.ones(self.total_requests, dtype=np.bool_) if self.log_successes else ~self.success
+        shard_sizes = [len(column) for column in columns["status_codes"]]
+        bounds = np.cumsum([0] + shard_sizes)
+        shard_files = [open(shard_log, 'rb') for shard_log in shard_logs]
+        try:
+            shard_records = []
+            for shard_file, first, last in zip(shard_files, bounds[:-1], bounds[1:]):
+                indices = first + np.flatnonzero(logged[first:last])
+                indices = indices[np.argsort(self.timestamps_ns[indices], kind="stable")]
+                shard_records.append(self._iter_in_start_order(shard_file, indices))
+            with open(self.log_file, 'wb') as f:
+                f.writelines(line for _, line in heapq.merge(*shard_records, key=lambda record: record[0]))
+        finally:
+            for shard_file in shard_files:
+                shard_file.close()
+        self._write_manifest()
+        self._save_metrics()
+
+        for shard_log in map(Path, shard_logs):
+            for path in (shard_log, shard_log.with_suffix('.npz'), shard_log.with_suffix('.manifest.json')):
+                path.unlink(missing_ok=True)
 
-        self._log_result(result)
-        return result
+    def _iter_in_start_order(self, shard_file, indices: np.ndarray):
+        # A shard logs in completion order; only records that arrive ahead of
+        # their turn are held back, so memory follows how far requests overtake
+        # each other rather than the size of the shard
+        waiting = {}
+        for index in indices.tolist():
+            request_id = index + 1
+            while request_id not in waiting:
+                line = shard_file.readline()
+                if not line:
+                    raise ValueError(f"Shard log {shard_file.name} has no record for request {request_id}")
+                waiting[orjson.loads(line)["request_id"]] = line
+            yield int(self.timestamps_ns[index]), waiting.pop(request_id)
 
-    def _log_result(self, result: dict[str, Any]):
+    async def _dispatch(self, client: Any):
         """
-        Log a single request result to the log file in JSONL format.
+        Run all requests through a fixed pool of worker coroutines.
+
+        concurrent_requests workers ask the weighted fair scheduler for the next
+        request as soon as they finish their previous one. Memory stays bounded
+        regardless of total_requests, a slow request never holds up the others,
+        and a slow target cannot take more than its weighted share of workers.
 
         Args:
-            result (dict): The request result to log
+            client: The backend client to use for making requests, as opened by run()
         """
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(result) + '\n')
+        scheduler = WeightedFairScheduler(self.targets)
+        self._body_buffers = [bytearray() for _ in range(self.concurrent_requests)]
+
+        async def worker(worker_index: int):
+            # The raw backend reads bodies in one piece and never touches the buffer
+            if self.backend != "raw":
+                self._body_buffers[worker_index] = bytearray(BODY_BUFFER_SIZE)
+            while (picked := scheduler.next()) is not None:
+                request_id, target_index = picked
+                try:
+                    await self.make_request(client, request_id, target_index, worker_index)
+                finally:
+                    scheduler.done(target_index)
+
+        workers = [asyncio.create_task(worker(i)) for i in range(self.concurrent_requests)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            self._body_buffers = []
 
     async def run(self):
         """
@@ -135,25 +1158,43 @@ class APIStressTester:
         This method creates a connection pool and manages concurrent requests
         according to the specified parameters.
         """
-        # Configure connection pooling limits
-        limits = httpx.Limits(max_keepalive_connections=self.concurrent_requests, max_connections=self.concurrent_requests)
-        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
-            tasks = []
-            for i in range(self.total_requests):
-                task = asyncio.create_task(self.make_request(client, i + 1))
-                tasks.append(task)
-                
-                # Execute batch of concurrent requests
-                if len(tasks) >= self.concurrent_requests:
-                    await asyncio.gather(*tasks)
-                    tasks = []
-            
-            # Execute any remaining tasks
-            if tasks:
-                await asyncio.gather(*tasks)
+        if self.body_sink is not None:
+            self.body_sink.mkdir(parents=True, exist_ok=True)
+        self._write_manifest()
+
+        # A single background task owns the log file for the whole run. The queue
+        # is bounded so queued lines and body copies cannot outgrow the disk
+        self._log_queue = asyncio.Queue(maxsize=self.concurrent_requests * 2)
+        writer = asyncio.create_task(self._log_writer())
+        try:
+            async with self._open_client() as client:
+                if self.backend == "httpx":
+                    # The JSON body (if any) is a fully buffered byte stream, so the same
+                    # request object can be sent any number of times
+                    self._request_templates = [
+                        self._build_httpx_request(client, target_index) for target_index in range(len(self.targets))
+                    ]
+                if self.warmup:
+                    await self._warm_up(client)
+                dispatch = asyncio.create_task(self._dispatch(client))
+                await asyncio.wait({dispatch, writer}, return_when=asyncio.FIRST_COMPLETED)
+                if not dispatch.done():
+                    # The writer only stops early when it fails; workers would
+                    # otherwise wait on the full queue forever
+                    dispatch.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await dispatch
+                    writer.result()
+                await dispatch
+        finally:
+            if not writer.done():
+                await self._log_queue.put(None)
+            await writer
+            self._log_queue = None
+            self._save_metrics()
 
 def run_stress_test(
-    url: str,
+    url: str | None = None,
     total_requests: int = 100,
     concurrent_requests: int = 10,
     headers: dict[str, str] | None = None,
@@ -161,14 +1202,26 @@ def run_stress_test(
     data: dict[str, Any] | None = None,
     method: str = "GET",
     log_file: str = "api_stress_test.jsonl",
-    timeout: float = 60.0
+    timeout: float = 60.0,
+    capture_body: bool = False,
+    capture_headers: bool = False,
+    body_sink: str | None = None,
+    http2: bool = True,
+    warmup: bool = True,
+    log_successes: bool = True,
+    backend: Literal["httpx", "aiohttp", "raw"] = "httpx",
+    targets: list[Target] | None = None,
+    starvation_limit: float | None = 0.01,
+    cancel_factor: float | None = None,
+    workers: int = 1
 ):
     """
     Convenience function to run an API stress test.
 
     Args:
-        url (str): The target API endpoint URL
-        total_requests (int): Total number of requests to make
+        url (str): The target API endpoint URL, when testing a single endpoint
+        total_requests (int): Total number of requests to make; split across targets by weight
+            unless every target sets its own count
         concurrent_requests (int): Number of requests to make concurrently
         headers (dict): Optional HTTP headers to include with each request
         params (dict): Optional query parameters to include with each request
@@ -176,7 +1229,22 @@ def run_stress_test(
         method (str): HTTP method to use (GET, POST, etc.)
         log_file (str): Path to the log file where results will be stored
         timeout (float): Request timeout in seconds
+        capture_body (bool): Record response bodies in addition to request metadata
+        capture_headers (bool): Record response headers in addition to request metadata
+        body_sink (str): Optional directory for captured bodies, one file per request
+        http2 (bool): Negotiate HTTP/2 so concurrent requests multiplex over shared connections
+        warmup (bool): Open the connection pool with unlogged HEAD requests before timing starts
+        log_successes (bool): Write a JSONL record for successful requests too, not only failures
+        backend (str): HTTP client to drive the requests with: "httpx", "aiohttp" or "raw"
+        targets (list): Several endpoints to test concurrently instead of url
+        starvation_limit (float): Maximum seconds to keep reading a response body before yielding
+        cancel_factor (float): Cancel requests slower than this multiple of their target's rolling p99
+        workers (int): Number of processes to split the requests and concurrency across, each
+            running its own event loop; their logs and metrics are merged afterwards
     """
+    if not 1 <= workers <= concurrent_requests:
+        raise ValueError("workers must be between 1 and concurrent_requests")
+
     # Create log file directory if it doesn't exist
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     
@@ -184,8 +1252,7 @@ def run_stress_test(
     with open(log_file, 'w') as f:
         pass
 
-    # Initialize and run the stress tester
-    tester = APIStressTester(
+    tester_kwargs = dict(
         base_url=url,
         total_requests=total_requests,
         concurrent_requests=concurrent_requests,
@@ -194,10 +1261,106 @@ def run_stress_test(
         data=data,
         method=method,
         log_file=log_file,
-        timeout=timeout
+        timeout=timeout,
+        capture_body=capture_body,
+        capture_headers=capture_headers,
+        body_sink=body_sink,
+        http2=http2,
+        warmup=warmup,
+        log_successes=log_successes,
+        backend=backend,
+        targets=targets,
+        starvation_limit=starvation_limit,
+        cancel_factor=cancel_factor
+    )
+
+    # Initialize and run the stress tester
+    tester = APIStressTester(**tester_kwargs)
+    if workers > 1:
+        _run_sharded(tester, tester_kwargs, workers)
+    else:
+        _run_event_loop(tester.run())
+
+    print(format_summary(tester.summarize()))
+
+def format_summary(summary: dict[str, Any]) -> str:
+    """
+    Render a run summary as a compact, human readable report.
+
+    Args:
+        summary (dict): The summary returned by APIStressTester.summarize()
+
+    Returns:
+        str: The report
+    """
+    lines = [
+        f"Requests: {summary['total_requests']} total, {summary['successful']} successful, "
+        f"{summary['failed']} failed ({summary['no_response']} without response)",
+        "Status codes: " + (", ".join(f"{code}: {count}" for code, count in summary["status_codes"].items()) or "none"),
+    ]
+    if summary["response_time_ms"]:
+        lines.append("Response time (ms): " + ", ".join(
+            f"{name} {value:.2f}" for name, value in summary["response_time_ms"].items()
+        ))
+    lines.append(
+        f"Throughput: {summary['requests_per_second']:.1f} req/s over {summary['duration_s']:.2f}s, "
+        f"peak {summary['peak_requests_per_second']:.1f} req/s"
     )
+    return "\n".join(lines)
+
+def _run_event_loop(main):
+    # uvloop is a drop-in, faster event loop where available (not on Windows)
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(main)
+
+def _run_shard(tester_kwargs: dict[str, Any]):
+    # Entry point of each worker process; every process runs its own event loop
+    _run_event_loop(APIStressTester(**tester_kwargs).run())
+
+def _run_sharded(tester: APIStressTester, tester_kwargs: dict[str, Any], workers: int):
+    """
+    Split a stress test across worker processes and merge their results.
+
+    Every target's request count and the concurrency budget are divided as
+    evenly as possible across the workers. Each worker logs to its own shard
+    file in a .shards directory next to log_file, with request ids offset so
+    they stay unique across shards.
+
+    Args:
+        tester (APIStressTester): Tester configured for the whole run, used to merge the shards
+        tester_kwargs (dict): Keyword arguments the tester was created with
+        workers (int): Number of worker processes
+    """
+    # A separate directory keeps the shards' metrics and manifests from colliding
+    # with the merged ones, whatever suffix log_file has
+    shard_dir = Path(tester.log_file).with_name(Path(tester.log_file).name + ".shards")
+    shard_dir.mkdir(exist_ok=True)
+    shards = []
+    request_id_offset = 0
+    for i in range(workers):
+        targets = [
+            target._replace(count=target.count // workers + (i < target.count % workers))
+            for target in tester.targets
+        ]
+        shard_log = str(shard_dir / f"{i}.jsonl")
+        open(shard_log, 'w').close()
+        shards.append({
+            **tester_kwargs,
+            "base_url": None,
+            "targets": targets,
+            "concurrent_requests": tester.concurrent_requests // workers + (i < tester.concurrent_requests % workers),
+            "log_file": shard_log,
+            "request_id_offset": request_id_offset,
+        })
+        request_id_offset += sum(target.count for target in targets)
+
+    # spawn rather than fork, so no event loop or open client state leaks into the workers
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        list(pool.map(_run_shard, shards))
 
-    asyncio.run(tester.run())
+    tester.merge_shards([shard["log_file"] for shard in shards])
+    shard_dir.rmdir()
 
 if __name__ == "__main__":
     # Example usage